@@ -1,76 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import base64
+import hashlib
+import hmac
 import os
-import re
 import sqlite3
+import string
+import struct
+import threading
+import time
 
-import bcrypt
-import pyotp
-import qrcode
-
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
 from kivy.lang import Builder
+from kivy.logger import Logger
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivymd.app import MDApp
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.button import MDRaisedButton
 from kivy.core.window import Window
-from kivy.resources import resource_add_path, resource_find
+from kivy.resources import resource_add_path
 
 
 # ---------------- Paths ----------------
 BASE_DIR = Path(__file__).resolve().parent
-ASSETS_DIR = (BASE_DIR / ".." / "assets").resolve()
-UI_DIR = (BASE_DIR / ".." / "ui").resolve()
+ROOT_DIR = BASE_DIR.parent  # BASE_DIR is already resolved; no need to resolve ".." again
+ASSETS_DIR = ROOT_DIR / "assets"
+UI_DIR = ROOT_DIR / "ui"
 KV_PATH = UI_DIR / "main.kv"
-QR_PATH = ASSETS_DIR / "totp_qr.png"
+ICON_PATH = ASSETS_DIR / "icon.ico"
+DB_PATH = "users.db"
+SCHEMA_VERSION = 1  # bump when ensure_users_table gains a migration step
+
+
+# ---------------- Config ----------------
+# bcrypt cost factor for new hashes. Each +1 doubles hashing time; 10 is the
+# OWASP minimum. Existing hashes embed their own cost, so checkpw is unaffected.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+if not 10 <= BCRYPT_ROUNDS <= 31:
+    # fail at launch rather than inside the first signup/login worker
+    raise ValueError(f"BCRYPT_ROUNDS must be between 10 and 31, got {BCRYPT_ROUNDS}")
+
+
+# ---------------- SQL ----------------
+# Kept as constants so the connection's statement cache sees identical text.
+# CAST keeps rows written as TEXT by older builds coming back as bytes for bcrypt
+SQL_GET_USER = "SELECT CAST(password AS BLOB), totp_secret FROM users WHERE email = ?"
+SQL_INSERT_USER = "INSERT INTO users (email, password, totp_secret) VALUES (?, ?, ?)"
+SQL_UPDATE_PASSWORD = "UPDATE users SET password = ? WHERE email = ?"
 
-ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+
+# ---------------- Workers ----------------
+# bcrypt + DB work for login/signup; results are handed back via Clock.schedule_once
+_AUTH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth")
 
 
 # ---------------- Helpers ----------------
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + ".!#$%&'*+/=?^_`{|}~-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_PWD_SPECIALS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+
 def validateEmail(email: str) -> bool:
-    pattern = (r"^(?!\.)(?!.*\.\.)[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+"
-               r"@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}$")
-    return re.match(pattern, email) is not None
+    # local@name.tld with no leading dot and no ".." anywhere
+    local, at, domain = email.partition("@")
+    name, dot, tld = domain.rpartition(".")
+    if not (at and dot and local and name and len(tld) >= 2):
+        return False
+    if local[0] == "." or ".." in email:
+        return False
+    return (_EMAIL_LOCAL_CHARS.issuperset(local)
+            and _EMAIL_DOMAIN_CHARS.issuperset(name)
+            and _ASCII_LETTERS.issuperset(tld))
+
+
+def bcrypt_needs_rehash(stored_hash: bytes) -> bool:
+    # "$2b$<cost>$..." — only hashes weaker than BCRYPT_ROUNDS are migrated; never downgrade
+    try:
+        cost = int(stored_hash[4:6])
+    except ValueError:
+        return False
+    return cost < BCRYPT_ROUNDS
+
+
+def password_ok(password: str) -> bool:
+    # ≥8 chars with an uppercase letter, a digit and a special char, in one pass
+    if len(password) < 8:
+        return False
+    upper = digit = special = False
+    for c in password:
+        if "A" <= c <= "Z":
+            upper = True
+        elif "0" <= c <= "9":
+            digit = True
+        elif c in _PWD_SPECIALS:
+            special = True
+    return upper and digit and special
+
+
+def totp_ok(secret: str, code: str) -> bool:
+    """RFC 6238 check (SHA1, 6 digits, 30s) of code against the current step ±1."""
+    # malformed input can never match; skip the HMACs (length/charset are not secret)
+    if len(code) != 6 or not (code.isascii() and code.isdigit()):
+        return False
+    # pyotp secrets may be unpadded; decoding is cheap, and nothing keeps the key after the check
+    key = base64.b32decode(secret + "=" * (-len(secret) % 8), casefold=True)
+    counter = int(time.time()) // 30
+    code = code.encode("utf-8")
+    # current step first: that is where a live code almost always lands. Stopping on a
+    # match only reveals which step matched, not anything about the expected code.
+    for step in (counter, counter - 1, counter + 1):
+        mac = hmac.new(key, struct.pack(">Q", step), hashlib.sha1).digest()
+        offset = mac[-1] & 0x0F
+        otp = (struct.unpack(">I", mac[offset:offset + 4])[0] & 0x7FFFFFFF) % 1_000_000
+        if hmac.compare_digest(b"%06d" % otp, code):
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def _dialog_classes():
+    # kivymd.uix.dialog/button are only needed once a popup is shown
+    from kivymd.uix.button import MDRaisedButton
+    from kivymd.uix.dialog import MDDialog
+    return MDDialog, MDRaisedButton
+
+
+def qr_pixels(data):
+    """Render data as a QR matrix; returns (side, rgb bytes) in Kivy's bottom-up row order."""
+    import qrcode
+
+    qr = qrcode.QRCode(border=2)
+    qr.add_data(data)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    dark, light = b"\x00\x00\x00", b"\xff\xff\xff"
+    return len(matrix), b"".join(dark if cell else light for row in reversed(matrix) for cell in row)
+
+
+def qr_texture(side, pixels):
+    # one texel per module; nearest filtering keeps edges sharp when scaled up
+    tex = Texture.create(size=(side, side), colorfmt="rgb")
+    tex.mag_filter = "nearest"
+    tex.blit_buffer(pixels, colorfmt="rgb", bufferfmt="ubyte")
+    return tex
 
 
 def ensure_users_table(conn: sqlite3.Connection):
+    # user_version records the applied schema, so an up-to-date DB costs a single PRAGMA read
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
     cur = conn.cursor()
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS users (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             email TEXT UNIQUE,
-            password TEXT,
+            password BLOB,
             totp_secret TEXT
         )
         """
     )
+    # databases created before 2FA have no totp_secret column
+    columns = {r[1] for r in cur.execute("PRAGMA table_info(users)")}
+    if "totp_secret" not in columns:
+        cur.execute("ALTER TABLE users ADD COLUMN totp_secret TEXT")
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
 
 
+def open_db(path=DB_PATH) -> sqlite3.Connection:
+    # one long-lived connection for the whole app; callers serialize on MyApp.db_lock
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    ensure_users_table(conn)
+    return conn
+
+
 # ---------------- Screens ----------------
-class homeScreen(Screen):
+class PopupScreen(Screen):
     dialog = None
-    rtrue = False
-    pending_user_email = None  # set after password OK, before TOTP
 
     def show_popup(self, title, message):
-        if self.dialog:
-            self.dialog.dismiss()
-        self.dialog = MDDialog(
-            title=title,
-            text=message,
-            size_hint=(0.8, 0.4),
-            buttons=[MDRaisedButton(text="OK", on_release=lambda x: self.dialog.dismiss())],
-        )
+        # one dialog per screen, built on first use; later popups only swap its text
+        if self.dialog is None:
+            MDDialog, MDRaisedButton = _dialog_classes()
+            self.dialog = MDDialog(
+                title=title,
+                text=message,
+                size_hint=(0.8, 0.4),
+                buttons=[MDRaisedButton(text="OK", on_release=self._dismiss_dialog)],
+            )
+        else:
+            self.dialog.title = title
+            self.dialog.text = message
         self.dialog.open()
 
+    def _dismiss_dialog(self, *_):
+        self.dialog.dismiss()
+
+    def run_in_background(self, fn, *args):
+        # an exception in fn is stored on the Future; the callback makes sure it is seen
+        _AUTH_POOL.submit(fn, *args).add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, fut):
+        exc = fut.exception()
+        if exc is not None:
+            Logger.error("Auth: background task failed", exc_info=exc)
+            Clock.schedule_once(lambda dt: self._on_worker_error())
+
+    def _on_worker_error(self):
+        self.show_popup("Error", "Something went wrong. Please try again.")
+
+
+class homeScreen(PopupScreen):
+    rtrue = False
+    pending_user_email = None  # set after password OK, before TOTP
+    pending_totp_secret = None  # fetched with the password hash in step 1
+
     def clear_fields(self):
-        if self.rtrue:
-            # remember-me keeps current text
-            self.ids.user.text = self.ids.user.text
-            self.ids.psswd.text = self.ids.psswd.text
-        else:
+        # remember-me keeps current text
+        if not self.rtrue:
             self.ids.user.text = ""
             self.ids.psswd.text = ""
         # clear TOTP UI contents
@@ -80,47 +233,62 @@ class homeScreen(Screen):
     def remember(self):
         self.rtrue = not self.rtrue
 
-    # Login step 1: password check
+    # Login step 1: password check (bcrypt runs off the UI thread)
     def verify(self, user, psswd):
-        database = "users.db"
-        try:
-            with sqlite3.connect(database) as conn:
-                ensure_users_table(conn)
-                cursor = conn.cursor()
-                cursor.execute("SELECT password FROM users WHERE email = ?", (user,))
-                row = cursor.fetchone()
-
-                if not row:
-                    self.show_popup("Error", "User not found.")
-                    self.clear_fields()
-                    return False
-
-                stored_hash = row[0]
-                # stored_hash may be str or bytes depending on insert
-                if isinstance(stored_hash, str):
-                    stored_hash = stored_hash.encode("utf-8")
-
-                ok = bcrypt.checkpw(psswd.encode("utf-8"), stored_hash)
-                if not ok:
-                    self.show_popup("Error", "Invalid email or password.")
-                    self.clear_fields()
-                    return False
-
-                # Password is correct → show TOTP step
-                self.pending_user_email = user
-                self.show_totp_box()
-                self.show_popup("2FA Required", "Enter the 6-digit code from your authenticator.")
-                return True
+        self.run_in_background(self._verify_worker, user, psswd)
+
+    def _verify_worker(self, user, psswd):
+        import bcrypt
 
+        app = MDApp.get_running_app()
+        try:
+            with app.db_lock:
+                row = app.db.execute(SQL_GET_USER, (user,)).fetchone()
         except sqlite3.Error as e:
-            self.show_popup("Error", f"Database error: {e}")
-            return False
+            msg = f"Database error: {e}"
+            Clock.schedule_once(lambda dt: self.show_popup("Error", msg))
+            return
+
+        ok = False
+        # only bcrypt ("$2a$/$2b$/$2y$") hashes are checked; anything else is a plain mismatch
+        if row and row[0] and row[0].startswith(b"$2"):
+            ok = bcrypt.checkpw(psswd.encode("utf-8"), row[0])
+
+        # report first so the TOTP step doesn't wait on the second hash below
+        Clock.schedule_once(lambda dt: self._on_verify_result(user, row, ok))
+
+        if ok and bcrypt_needs_rehash(row[0]):
+            try:
+                new_hash = bcrypt.hashpw(psswd.encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS))
+                with app.db_lock, app.db:
+                    app.db.execute(SQL_UPDATE_PASSWORD, (new_hash, user))
+            except Exception as e:
+                # the old hash still verifies; try again next login
+                Logger.warning(f"Auth: password rehash failed: {e}")
+
+    def _on_verify_result(self, user, row, ok):
+        if not row:
+            self.show_popup("Error", "User not found.")
+            self.clear_fields()
+            return
+
+        if not ok:
+            self.show_popup("Error", "Invalid email or password.")
+            self.clear_fields()
+            return
+
+        # Password is correct → show TOTP step
+        self.pending_user_email = user
+        self.pending_totp_secret = row[1]
+        self.show_totp_box()
 
     def show_totp_box(self):
         box = self.ids.totp_box
         box.opacity = 1
         box.disabled = False
         box.height = "90dp"
+        # focus the code field so the next step is obvious without an extra popup
+        self.ids.totp_input.focus = True
 
     # Login step 2: TOTP
     def verify_totp(self, code_text):
@@ -128,54 +296,32 @@ class homeScreen(Screen):
             self.show_popup("Error", "No user in 2FA flow.")
             return
 
-        database = "users.db"
-        try:
-            with sqlite3.connect(database) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT totp_secret FROM users WHERE email = ?",
-                    (self.pending_user_email,),
-                )
-                row = cursor.fetchone()
-
-                if not row or not row[0]:
-                    self.show_popup("Error", "2FA not configured for this account.")
-                    return
-
-                secret = row[0]
-                if pyotp.TOTP(secret).verify(code_text.strip(), valid_window=1):
-                    self.show_popup("Success", "Login successful!")
-                    self.clear_fields()
-                    # hide TOTP box again
-                    box = self.ids.totp_box
-                    box.opacity = 0
-                    box.disabled = True
-                    box.height = 0
-                    self.manager.current = "sScreen"
-                else:
-                    self.show_popup("Error", "Invalid 2FA code. Try again.")
+        secret = self.pending_totp_secret
+        if not secret:
+            self.show_popup("Error", "2FA not configured for this account.")
+            return
 
-        except sqlite3.Error as e:
-            self.show_popup("Error", f"Database error: {e}")
+        if totp_ok(secret, code_text.strip()):
+            self.pending_user_email = None
+            self.pending_totp_secret = None
+            self.show_popup("Success", "Login successful!")
+            self.clear_fields()
+            # hide TOTP box again
+            box = self.ids.totp_box
+            box.opacity = 0
+            box.disabled = True
+            box.height = 0
+            self.manager.current = "sScreen"
+        else:
+            self.show_popup("Error", "Invalid 2FA code. Try again.")
 
 
-class signUp(Screen):
-    dialog = None
+class signUp(PopupScreen):
     # temp state while enrolling TOTP before inserting into DB
     pending_email = None
     pending_pwd_hash = None
     pending_totp_secret = None
-
-    def show_popup(self, title, message):
-        if self.dialog:
-            self.dialog.dismiss()
-        self.dialog = MDDialog(
-            title=title,
-            text=message,
-            size_hint=(0.8, 0.4),
-            buttons=[MDRaisedButton(text="OK", on_release=lambda x: self.dialog.dismiss())],
-        )
-        self.dialog.open()
+    signup_busy = False  # INSERT in flight; ignore repeat taps until it reports back
 
     def clear_fields(self):
         if "username_input" in self.ids:
@@ -191,38 +337,47 @@ class signUp(Screen):
             self.show_popup("Error", "Email is invalid.")
             return
 
-        pattern = r'^(?=.*[A-Z])(?=.*[0-9])(?=.*[!@#$%^&*(),.?":{}|<>]).{8,}$'
-        if not re.match(pattern, password):
+        if not password_ok(password):
             self.show_popup(
                 "Error",
                 "Password must be ≥8 chars and include a capital letter, a number, and a special char.",
             )
             return
 
+        # bcrypt + QR rendering are CPU-bound; keep them off the UI thread
+        self.run_in_background(self._enroll_worker, username, password)
+
+    def _enroll_worker(self, username, password):
+        import bcrypt
+        import pyotp
+
         # Prepare bcrypt + TOTP
         try:
-            pwd_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+            pwd_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS))
             secret = pyotp.random_base32()
             issuer = "VaultScribe"
             uri = pyotp.totp.TOTP(secret).provisioning_uri(name=username, issuer_name=issuer)
 
-            # Save temp state until code verified
-            self.pending_email = username
-            self.pending_pwd_hash = pwd_hash
-            self.pending_totp_secret = secret
+            # Build the QR matrix here; the texture itself must be made on the GL thread
+            side, pixels = qr_pixels(uri)
 
-            # Generate QR image
-            img = qrcode.make(uri)
-            img.save(QR_PATH)
+        except Exception as e:
+            msg = f"Setup failed: {e}"
+            Clock.schedule_once(lambda dt: self.show_popup("Error", msg))
+            return
 
-            # Show TOTP enrollment UI (QR + code box)
-            self.show_totp_enroll_ui()
-            self.show_popup("Verify 2FA", "Scan the QR in your authenticator and enter the 6-digit code.")
+        Clock.schedule_once(lambda dt: self._on_enroll_ready(username, pwd_hash, secret, side, pixels))
 
-        except Exception as e:
-            self.show_popup("Error", f"Setup failed: {e}")
+    def _on_enroll_ready(self, username, pwd_hash, secret, side, pixels):
+        # Save temp state until code verified
+        self.pending_email = username
+        self.pending_pwd_hash = pwd_hash
+        self.pending_totp_secret = secret
 
-    def show_totp_enroll_ui(self):
+        # Show TOTP enrollment UI (QR + code box)
+        self.show_totp_enroll_ui(qr_texture(side, pixels))
+
+    def show_totp_enroll_ui(self, qr):
         # hide normal inputs within the sign-up card
         for w in ("sBox", "cBox", "username_input", "password_input"):
             if w in self.ids:
@@ -235,13 +390,15 @@ class signUp(Screen):
         enroll.opacity = 1
         enroll.height = "300dp"
         if "totp_qr" in self.ids:
-            self.ids.totp_qr.source = str(QR_PATH)
-            self.ids.totp_qr.reload()
+            self.ids.totp_qr.texture = qr
 
     def hide_totp_enroll_ui(self):
         enroll = self.ids.totp_enroll_box
         enroll.opacity = 0
         enroll.height = 0
+        # the QR encodes the TOTP secret; don't leave it on the texture
+        if "totp_qr" in self.ids:
+            self.ids.totp_qr.texture = None
         # show normal inputs again
         for w in ("sBox", "cBox", "username_input", "password_input"):
             if w in self.ids:
@@ -250,66 +407,75 @@ class signUp(Screen):
                     self.ids[w].disabled = False
 
     def complete_signup(self):
+        if self.signup_busy:
+            return
+
         # verify 6-digit code then insert user
         code = self.ids.totp_code_signup.text.strip() if "totp_code_signup" in self.ids else ""
         if not (self.pending_email and self.pending_pwd_hash and self.pending_totp_secret):
             self.show_popup("Error", "TOTP enrollment not initialized.")
             return
 
-        if not pyotp.TOTP(self.pending_totp_secret).verify(code, valid_window=1):
+        if not totp_ok(self.pending_totp_secret, code):
             self.show_popup("Error", "Invalid 2FA code. Please try again.")
             return
 
-        try:
-            database = "users.db"
-            with sqlite3.connect(database) as conn:
-                ensure_users_table(conn)
-                cursor = conn.cursor()
-                cursor.execute(
-                    "INSERT INTO users (email, password, totp_secret) VALUES (?, ?, ?)",
-                    (self.pending_email, self.pending_pwd_hash, self.pending_totp_secret),
-                )
-                conn.commit()
-
-            # cleanup temp + UI
-            self.pending_email = None
-            self.pending_pwd_hash = None
-            self.pending_totp_secret = None
-            self.clear_fields()
-            self.hide_totp_enroll_ui()
-            self.show_popup("Success", "Account created with 2FA.")
-            self.manager.current = "home"
+        self.signup_busy = True
+        self.run_in_background(
+            self._signup_worker, self.pending_email, self.pending_pwd_hash, self.pending_totp_secret
+        )
 
+    def _signup_worker(self, email, pwd_hash, secret):
+        app = MDApp.get_running_app()
+        try:
+            with app.db_lock, app.db:
+                app.db.execute(SQL_INSERT_USER, (email, pwd_hash, secret))
         except sqlite3.IntegrityError:
-            self.show_popup("Error", "An account with this email already exists.")
+            msg = "An account with this email already exists."
+            Clock.schedule_once(lambda dt: self._on_signup_failed(msg))
+            return
         except sqlite3.Error as e:
-            self.show_popup("Error", f"Database error: {e}")
+            msg = f"Database error: {e}"
+            Clock.schedule_once(lambda dt: self._on_signup_failed(msg))
+            return
+
+        Clock.schedule_once(lambda dt: self._on_signup_done())
+
+    def _on_signup_failed(self, msg):
+        self.signup_busy = False
+        self.show_popup("Error", msg)
+
+    def _on_worker_error(self):
+        self.signup_busy = False
+        super()._on_worker_error()
+
+    def _on_signup_done(self):
+        # cleanup temp + UI
+        self.signup_busy = False
+        self.pending_email = None
+        self.pending_pwd_hash = None
+        self.pending_totp_secret = None
+        self.clear_fields()
+        self.hide_totp_enroll_ui()
+        self.show_popup("Success", "Account created with 2FA.")
+        self.manager.current = "home"
 
 
 class sScreen(Screen):
     pass
 
 
-class changeScreen(Screen):
+class changeScreen(PopupScreen):
     # placeholder; wire a password-reset flow later
-    dialog = None
-
-    def show_popup(self, title, message):
-        if self.dialog:
-            self.dialog.dismiss()
-        self.dialog = MDDialog(
-            title=title,
-            text=message,
-            size_hint=(0.8, 0.4),
-            buttons=[MDRaisedButton(text="OK", on_release=lambda x: self.dialog.dismiss())],
-        )
-        self.dialog.open()
+    pass
 
 
 # ---------------- App ----------------
 class MyApp(MDApp):
     def build(self):
         self.title = "VaultScribe"
+        self.db = open_db()
+        self.db_lock = threading.Lock()
         self._set_window_icon()
 
         self.theme_cls.theme_style = "Dark"
@@ -322,24 +488,24 @@ class MyApp(MDApp):
         sm.add_widget(changeScreen(name="changeScreen"))
         return sm
 
+    def on_stop(self):
+        # let in-flight login/signup/rehash work finish before the connection goes away
+        _AUTH_POOL.shutdown(wait=True)
+        with self.db_lock:
+            self.db.close()
+
     def _set_window_icon(self):
-        """Set a reliable desktop window icon (ICO preferred on Windows)."""
+        """Set the desktop window icon from the prebuilt assets/icon.ico."""
         # Allow kivy to find assets by name
         resource_add_path(str(ASSETS_DIR))
 
-        # Try ICO first, then PNG fallbacks
-        for candidate in ("icon.ico", "icon_256.png", "icon.png"):
-            path = resource_find(candidate)
-            if path:
-                try:
-                    Window.set_icon(path)  # desktop window icon
-                    self.icon = path       # app icon in some contexts/packagers
-                    return
-                except Exception:
-                    pass  # try next option
+        if ICON_PATH.exists():
+            Window.set_icon(str(ICON_PATH))  # desktop window icon
+            self.icon = str(ICON_PATH)       # app icon in some contexts/packagers
 
     def take_shot(self, name="screen"):
         # Saves to ../assets/<name>.png
+        ASSETS_DIR.mkdir(parents=True, exist_ok=True)
         path = ASSETS_DIR / f"{name}.png"
         Window.screenshot(name=str(path))
 
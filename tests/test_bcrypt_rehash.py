@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("kivymd")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "services"))
+import Main  # noqa: E402
+
+# prefix is all bcrypt_needs_rehash reads; the rest is a 53-char salt+digest
+_DIGEST = b"." * 53
+
+
+def test_stronger_hash_is_left_untouched(monkeypatch):
+    monkeypatch.setattr(Main, "BCRYPT_ROUNDS", 10)
+    assert not Main.bcrypt_needs_rehash(b"$2b$12$" + _DIGEST)
+
+
+def test_same_cost_is_left_untouched(monkeypatch):
+    monkeypatch.setattr(Main, "BCRYPT_ROUNDS", 10)
+    assert not Main.bcrypt_needs_rehash(b"$2b$10$" + _DIGEST)
+
+
+def test_weaker_hash_is_migrated_up(monkeypatch):
+    monkeypatch.setattr(Main, "BCRYPT_ROUNDS", 10)
+    assert Main.bcrypt_needs_rehash(b"$2b$04$" + _DIGEST)